@@ -23,17 +23,24 @@ Key behaviors:
 """
 
 import argparse
+import hashlib
+import http.client
 import json
 import os
+import pickle
 import re
+import sqlite3
 import sys
 import threading
 import time
+import urllib.parse
 import urllib.request
 import urllib.error
 from collections import defaultdict
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor, as_completed
+from functools import lru_cache
 from pathlib import Path
-from typing import Dict, List, Optional, Set, Tuple
+from typing import AbstractSet, Dict, Iterator, List, Optional, Sequence, Set, Tuple
 
 # ============================================================================
 # SINGLE SOURCE OF TRUTH - Edit these lists to add new providers/brands/terms
@@ -55,6 +62,17 @@ TECH_TERMS = ["API"]
 # Newline marker for v2 format
 NEWLINE_MARKER = "[NL]"
 
+# Keep-lists as they appear in export headers and API prompts
+BRANDS_STR = ", ".join(BRANDS)
+TECH_TERMS_STR = ", ".join(TECH_TERMS)
+
+# Precompiled patterns for the per-line hot loops
+_NUMBERED_LINE_RE = re.compile(r'^(\d+)\.\s*(.*)$')
+# Same line shape, matched across a whole buffer ([^\S\n] keeps it on one line)
+_NUMBERED_LINES_RE = re.compile(r'^(\d+)\.[^\S\n]*(.*)$', re.MULTILINE)
+# key = "value" pairs in apikeys.lua
+_APIKEY_RE = re.compile(r'(\w+)\s*=\s*"([^"]*)"')
+
 # ============================================================================
 # Language Configuration
 # ============================================================================
@@ -88,6 +106,9 @@ LANGUAGE_NAMES = {
     "fa": "Persian (Farsi)",
 }
 
+# Stable display/processing order for the 'all' commands
+LANGUAGE_CODES = tuple(sorted(LANGUAGE_NAMES))
+
 # ============================================================================
 # Newline Handler
 # ============================================================================
@@ -98,8 +119,13 @@ class NewlineHandler:
     MARKER = NEWLINE_MARKER
 
     @staticmethod
+    @lru_cache(maxsize=65536)
     def encode(text: str) -> str:
-        """Replace actual newlines with marker for export."""
+        """Replace actual newlines with marker for export.
+
+        Memoized: every language's PO shares the same msgids, so a
+        multi-language run encodes each source string only once.
+        """
         return text.replace('\n', NewlineHandler.MARKER)
 
     @staticmethod
@@ -116,34 +142,75 @@ class NewlineHandler:
 # Placeholder Validator
 # ============================================================================
 
+def _compile_term_pattern(terms: List[str]) -> Tuple[Optional[re.Pattern], List[str]]:
+    """Compile one alternation that finds which of `terms` occur in a string.
+
+    Terms that overlap or contain another term could hide each other in a
+    single left-to-right scan, so they are returned separately for a plain
+    substring check. Returns (pattern, unscanned_terms).
+    """
+    def overlaps(a: str, b: str) -> bool:
+        return a != b and (b in a or any(a.endswith(b[:k]) for k in range(1, len(b))))
+
+    unscanned = [a for a in terms if any(overlaps(a, b) or overlaps(b, a) for b in terms)]
+    scanned = [t for t in terms if t not in unscanned]
+    pattern = re.compile('|'.join(map(re.escape, scanned))) if scanned else None
+    return pattern, unscanned
+
+
 class PlaceholderValidator:
     """Validate placeholders and brand names in translations."""
 
     PLACEHOLDER_PATTERN = re.compile(r'%[1-9]')
+    WRONG_PLACEHOLDER_PATTERN = re.compile(r'%[sdf]')
+    # BRANDS is short enough that plain substring checks win
+    PROVIDER_PATTERN, UNSCANNED_PROVIDERS = _compile_term_pattern(PROVIDERS)
+    TECH_TERMS_UPPER = [(term, term.upper()) for term in TECH_TERMS]
+
+    @classmethod
+    def find_providers(cls, text: str) -> Set[str]:
+        """Return the provider names that appear in text."""
+        found = set(cls.PROVIDER_PATTERN.findall(text)) if cls.PROVIDER_PATTERN else set()
+        for term in cls.UNSCANNED_PROVIDERS:
+            if term in text:
+                found.add(term)
+        return found
 
     @classmethod
     def extract_placeholders(cls, text: str) -> List[str]:
         """Extract all %N placeholders from text."""
         return cls.PLACEHOLDER_PATTERN.findall(text)
 
+    @staticmethod
+    def count_placeholders(text: str) -> List[int]:
+        """Count %1..%9 in one pass; index N holds the count of %N."""
+        counts = [0] * 10
+        i = text.find('%')
+        while i != -1:
+            digit = text[i + 1:i + 2]
+            if '1' <= digit <= '9':
+                counts[ord(digit) - 48] += 1
+            i = text.find('%', i + 1)
+        return counts
+
     @classmethod
     def validate(cls, source: str, translation: str) -> List[str]:
         """Return list of validation errors."""
         errors = []
 
-        # Check placeholder counts
-        source_ph = cls.extract_placeholders(source)
-        trans_ph = cls.extract_placeholders(translation)
-
-        for ph in set(source_ph):
-            src_count = source_ph.count(ph)
-            trans_count = trans_ph.count(ph)
-            if src_count != trans_count:
-                errors.append(f"Placeholder {ph} count mismatch: source={src_count}, trans={trans_count}")
+        # Check placeholder counts (most UI strings have no % at all)
+        source_counts = cls.count_placeholders(source) if '%' in source else None
+        if source_counts and any(source_counts):
+            trans_counts = cls.count_placeholders(translation)
+            for digit in range(1, 10):
+                src_count = source_counts[digit]
+                trans_count = trans_counts[digit]
+                if src_count and src_count != trans_count:
+                    errors.append(f"Placeholder %{digit} count mismatch: source={src_count}, trans={trans_count}")
 
-        # Check for wrong placeholder format
-        if source_ph and re.search(r'%[sdf]', translation):
-            errors.append("Wrong placeholder format (use %1, %2, not %s, %d)")
+            # Check for wrong placeholder format
+            if cls.WRONG_PLACEHOLDER_PATTERN.search(translation):
+                errors.append("Wrong placeholder format (use %1, %2, not %s, %d)")
 
         # Check newline marker count
         source_nl = source.count(NEWLINE_MARKER)
@@ -164,14 +231,22 @@ class PlaceholderValidator:
         warnings = []
 
         # Check provider names (WARNING if missing)
-        for provider in PROVIDERS:
-            if provider in source and provider not in translation:
-                warnings.append(f"Provider '{provider}' should be preserved")
-
-        # Check technical terms
-        for term in TECH_TERMS:
-            if term.upper() in source.upper() and term.upper() not in translation.upper():
-                warnings.append(f"Technical term '{term}' should be preserved")
+        source_providers = cls.find_providers(source)
+        if source_providers:
+            trans_providers = cls.find_providers(translation)
+            for provider in PROVIDERS:
+                if provider in source_providers and provider not in trans_providers:
+                    warnings.append(f"Provider '{provider}' should be preserved")
+
+        # Check technical terms (uppercase each side at most once)
+        source_upper = source.upper()
+        trans_upper = None
+        for term, term_upper in cls.TECH_TERMS_UPPER:
+            if term_upper in source_upper:
+                if trans_upper is None:
+                    trans_upper = translation.upper()
+                if term_upper not in trans_upper:
+                    warnings.append(f"Technical term '{term}' should be preserved")
 
         return warnings
 
@@ -183,7 +258,7 @@ class PlaceholderValidator:
 
         # Fix %s -> %1, %d -> %2 etc
         source_ph = cls.extract_placeholders(source)
-        wrong_placeholders = re.findall(r'%[sdf]', result)
+        wrong_placeholders = cls.WRONG_PLACEHOLDER_PATTERN.findall(result)
 
         if wrong_placeholders and source_ph:
             for i, old_ph in enumerate(wrong_placeholders):
@@ -220,16 +295,18 @@ class BatchManager:
         """Split strings into batch files, return paths."""
         paths = []
         ranges = self.get_batch_ranges()
+        lang_name = LANGUAGE_NAMES.get(lang_code, lang_code)
+        keep_line = header.split('\n')[1] if '\n' in header else header  # Keep KEEP: line
 
         for batch_num, start, end in ranges:
             batch_path = output_dir / f"{lang_code}_batch_{batch_num}.txt"
-            lines = [f"# {LANGUAGE_NAMES.get(lang_code, lang_code)} - Batch {batch_num}/{len(ranges)} (strings {start}-{end})"]
-            lines.append(header.split('\n')[1] if '\n' in header else header)  # Keep KEEP: line
+            lines = [f"# {lang_name} - Batch {batch_num}/{len(ranges)} (strings {start}-{end})"]
+            lines.append(keep_line)
             lines.append("")
 
-            for num in range(start, end + 1):
-                if num in strings:
-                    lines.append(f"{num}. {strings[num]}")
+            # Ranges partition 1..total, so this is one lookup per string overall
+            lines.extend(f"{num}. {strings[num]}" for num in range(start, end + 1)
+                         if num in strings)
 
             with open(batch_path, 'w', encoding='utf-8') as f:
                 f.write('\n'.join(lines))
@@ -247,16 +324,8 @@ class BatchManager:
         batch_files = sorted(input_dir.glob(f"{lang_code}_batch_*.txt"))
 
         for batch_file in batch_files:
-            with open(batch_file, 'r', encoding='utf-8') as f:
-                content = f.read()
-
-            # Parse numbered lines
-            for line in content.split('\n'):
-                match = re.match(r'^(\d+)\.\s*(.*)$', line)
-                if match:
-                    num = int(match.group(1))
-                    text = match.group(2).strip()
-                    combined[num] = text
+            # Batch files use the v2 numbered format
+            combined.update(parse_v2_numbered_format(batch_file.read_text(encoding='utf-8')))
 
         return combined
 
@@ -264,22 +333,43 @@ class BatchManager:
 # PO File Parsing (from v1)
 # ============================================================================
 
+# Shared placeholder for list fields that haven't been populated yet; the
+# parser swaps in a real list on first append
+_EMPTY: Tuple = ()
+
+
 class POEntry:
     """Represents a single translation entry in a PO file."""
+
+    __slots__ = ('comments', 'references', 'flags', 'msgid', 'msgid_plural',
+                 'msgstr', 'msgstr_plural', 'line_number', 'is_header', 'is_fuzzy',
+                 '_msgid_encoded')
+
     def __init__(self):
-        self.comments: List[str] = []
-        self.references: List[str] = []
-        self.flags: List[str] = []
+        self.comments: Sequence[str] = _EMPTY
+        self.references: Sequence[str] = _EMPTY
+        self.flags: Sequence[str] = _EMPTY
         self.msgid: str = ""
         self.msgid_plural: str = ""
         self.msgstr: str = ""
-        self.msgstr_plural: List[str] = []
+        self.msgstr_plural: Sequence[str] = _EMPTY
         self.line_number: int = 0
         self.is_header: bool = False
+        # Flags only change while parsing, so the parser keeps this in sync
+        self.is_fuzzy: bool = False
+        self._msgid_encoded: Optional[str] = None
 
     @property
-    def is_fuzzy(self) -> bool:
-        return "fuzzy" in self.flags
+    def msgid_encoded(self) -> str:
+        """msgid with newlines encoded for the v2 format.
+
+        Computed on first use, after parsing, since msgid never changes after
+        that.
+        """
+        encoded = self._msgid_encoded
+        if encoded is None:
+            encoded = self._msgid_encoded = NewlineHandler.encode(self.msgid)
+        return encoded
 
     @property
     def is_translated(self) -> bool:
@@ -301,79 +391,105 @@ def parse_po_file(filepath: Path) -> List[POEntry]:
     entries = []
     current_entry = None
     current_field = None
-    line_number = 0
+    current_plural_idx = 0
 
     with open(filepath, 'r', encoding='utf-8') as f:
-        for line in f:
-            line_number += 1
-            line = line.rstrip('\n')
-
-            if not line.strip():
-                if current_entry and (current_entry.msgid or current_entry.is_header):
-                    entries.append(current_entry)
-                current_entry = None
-                current_field = None
-                continue
+        lines = f.read().split('\n')
+
+    # Bind globals and bound methods used on every line to locals
+    unescape = unescape_po_string
+    add_entry = entries.append
+    empty = _EMPTY
+
+    for line_number, line in enumerate(lines, 1):
+        # Dispatch on the first character: most lines are "..." continuations
+        # or # comments, so keyword prefixes are only compared on m-lines
+        first = line[:1]
+
+        if first not in ('"', '#', 'm') and not line.strip():
+            if current_entry and (current_entry.msgid or current_entry.is_header):
+                add_entry(current_entry)
+            current_entry = None
+            current_field = None
+            continue
 
-            if current_entry is None:
-                current_entry = POEntry()
-                current_entry.line_number = line_number
-
-            if line.startswith('#'):
-                current_entry.comments.append(line)
-                if line.startswith('#:'):
-                    refs = line[2:].strip().split()
-                    current_entry.references.extend(refs)
-                elif line.startswith('#,'):
-                    flags = line[2:].strip().split(',')
-                    current_entry.flags.extend([f.strip() for f in flags])
-                continue
+        if current_entry is None:
+            current_entry = POEntry()
+            current_entry.line_number = line_number
 
+        if first == '"':
+            # line is non-empty here, so a char compare replaces endswith()
+            if line[-1] == '"':
+                value = unescape(line[1:-1])
+                if current_field == 'msgid':
+                    current_entry.msgid += value
+                elif current_field == 'msgid_plural':
+                    current_entry.msgid_plural += value
+                elif current_field == 'msgstr':
+                    current_entry.msgstr += value
+                elif current_field and current_field.startswith('msgstr['):
+                    current_entry.msgstr_plural[current_plural_idx] += value
+            continue
+
+        if first == '#':
+            if current_entry.comments is empty:
+                current_entry.comments = []
+            current_entry.comments.append(line)
+            second = line[1:2]
+            if second == ':':
+                refs = line[2:].strip().split()
+                if current_entry.references is empty:
+                    current_entry.references = []
+                current_entry.references.extend(refs)
+            elif second == ',':
+                flags = line[2:].strip().split(',')
+                if current_entry.flags is empty:
+                    current_entry.flags = []
+                current_entry.flags.extend([f.strip() for f in flags])
+                current_entry.is_fuzzy = 'fuzzy' in current_entry.flags
+            continue
+
+        if first != 'm':
+            continue
+
+        # m-lines: msgid / msgid_plural / msgstr / msgstr[N]
+        kind = line[3:4]
+        if kind == 'i':
             if line.startswith('msgid '):
                 current_field = 'msgid'
                 value = line[6:].strip()
                 if value.startswith('"') and value.endswith('"'):
-                    current_entry.msgid = unescape_po_string(value[1:-1])
+                    current_entry.msgid = unescape(value[1:-1])
                     if not current_entry.msgid and entries == []:
                         current_entry.is_header = True
-                continue
-
-            if line.startswith('msgid_plural '):
+            elif line.startswith('msgid_plural '):
                 current_field = 'msgid_plural'
                 value = line[13:].strip()
                 if value.startswith('"') and value.endswith('"'):
-                    current_entry.msgid_plural = unescape_po_string(value[1:-1])
-                continue
-
+                    current_entry.msgid_plural = unescape(value[1:-1])
+        elif kind == 's':
             if line.startswith('msgstr '):
                 current_field = 'msgstr'
                 value = line[7:].strip()
                 if value.startswith('"') and value.endswith('"'):
-                    current_entry.msgstr = unescape_po_string(value[1:-1])
-                continue
-
-            match = re.match(r'msgstr\[(\d+)\] "(.*)"', line)
-            if match:
-                idx = int(match.group(1))
-                value = unescape_po_string(match.group(2))
-                while len(current_entry.msgstr_plural) <= idx:
-                    current_entry.msgstr_plural.append("")
-                current_entry.msgstr_plural[idx] = value
-                current_field = f'msgstr[{idx}]'
-                continue
-
-            if line.startswith('"') and line.endswith('"'):
-                value = unescape_po_string(line[1:-1])
-                if current_field == 'msgid':
-                    current_entry.msgid += value
-                elif current_field == 'msgid_plural':
-                    current_entry.msgid_plural += value
-                elif current_field == 'msgstr':
-                    current_entry.msgstr += value
-                elif current_field and current_field.startswith('msgstr['):
-                    idx = int(current_field[7:-1])
-                    current_entry.msgstr_plural[idx] += value
-                continue
+                    current_entry.msgstr = unescape(value[1:-1])
+            elif line.startswith('msgstr['):
+                # msgstr[N] "..." - slice the index instead of running a regex
+                close = line.find(']', 7)
+                digits = line[7:close]
+                last_quote = line.rfind('"')
+                if (close > 7 and digits.isdecimal() and line[close + 1:close + 3] == ' "'
+                        and last_quote >= close + 3):
+                    idx = int(digits)
+                    value = unescape(line[close + 3:last_quote])
+                    if current_entry.msgstr_plural is empty:
+                        current_entry.msgstr_plural = []
+                    missing = idx + 1 - len(current_entry.msgstr_plural)
+                    if missing > 0:
+                        current_entry.msgstr_plural.extend([""] * missing)
+                    current_entry.msgstr_plural[idx] = value
+                    current_field = f'msgstr[{idx}]'
+                    current_plural_idx = idx
 
     if current_entry and (current_entry.msgid or current_entry.is_header):
         entries.append(current_entry)
@@ -381,13 +497,98 @@ def parse_po_file(filepath: Path) -> List[POEntry]:
     return entries
 
 
+# Bump when POEntry, parse_po_file output or the validator code changes
+PARSE_CACHE_VERSION = 3
+
+# Cached validation results also depend on the editable lists at the top of
+# this file, so those are part of the key and edits take effect at once
+VALIDATION_INPUTS_DIGEST = hashlib.sha1(
+    repr((BRANDS, PROVIDERS, TECH_TERMS, NEWLINE_MARKER)).encode('utf-8')).hexdigest()
+
+
+def _cache_key(filepath: Path) -> Tuple[int, int, int]:
+    """Key a cache entry on the file's mtime and size."""
+    stat = filepath.stat()
+    return (PARSE_CACHE_VERSION, stat.st_mtime_ns, stat.st_size)
+
+
+def _validation_cache_key(filepath: Path) -> Tuple[int, int, int, str]:
+    """_cache_key for results that depend on validation (status, pending counts)."""
+    return _cache_key(filepath) + (VALIDATION_INPUTS_DIGEST,)
+
+
+def _cache_path(filepath: Path, cache_dir: Path, kind: str) -> Path:
+    name = hashlib.sha1(str(filepath.resolve()).encode('utf-8')).hexdigest()[:16]
+    return cache_dir / f"{name}.{kind}.pickle"
+
+
+def _read_cache(cache_path: Path, key: tuple):
+    """Return the cached value stored under key, or None if missing or stale."""
+    try:
+        with open(cache_path, 'rb') as f:
+            cached_key, value = pickle.load(f)
+        if cached_key == key:
+            return value
+    except Exception:
+        pass  # missing or unreadable cache
+    return None
+
+
+def _write_cache(cache_path: Path, key: tuple, value) -> None:
+    """Store value under key, atomically; caching is best-effort."""
+    tmp_path = cache_path.with_name(f"{cache_path.name}.{os.getpid()}.tmp")
+    try:
+        cache_path.parent.mkdir(parents=True, exist_ok=True)
+        with open(tmp_path, 'wb') as f:
+            pickle.dump((key, value), f, protocol=pickle.HIGHEST_PROTOCOL)
+        os.replace(tmp_path, cache_path)
+    except (OSError, pickle.PicklingError):
+        # Don't leave a partial temp file behind
+        try:
+            tmp_path.unlink(missing_ok=True)
+        except OSError:
+            pass
+
+
+def parse_po_file_cached(filepath: Path, cache_dir: Path) -> List[POEntry]:
+    """parse_po_file with an on-disk pickle cache keyed on mtime and size.
+
+    Falls back to a fresh parse whenever the cache is missing, stale or
+    unreadable, so the cache directory can be deleted at any time.
+    """
+    filepath = Path(filepath)
+    key = _cache_key(filepath)
+    cache_path = _cache_path(filepath, cache_dir, 'entries')
+
+    entries = _read_cache(cache_path, key)
+    if entries is None:
+        entries = parse_po_file(filepath)
+        _write_cache(cache_path, key, entries)
+    return entries
+
+
+_UNESCAPES = {'n': '\n', 't': '\t', '"': '"', '\\': '\\'}
+_UNESCAPE_RE = re.compile(r'\\([nt"\\])')
+
+
+def _unescape_match(match: re.Match) -> str:
+    return _UNESCAPES[match.group(1)]
+
+
 def unescape_po_string(s: str) -> str:
     """Unescape PO string escape sequences."""
-    return s.replace('\\n', '\n').replace('\\t', '\t').replace('\\"', '"').replace('\\\\', '\\')
+    if '\\' not in s:
+        return s
+    # One left-to-right pass, so an escaped backslash followed by "n" stays
+    # a backslash and an "n" rather than becoming a newline
+    return _UNESCAPE_RE.sub(_unescape_match, s)
 
 
 def escape_po_string(s: str) -> str:
     """Escape string for PO format."""
+    # Most UI strings contain nothing to escape
+    if '\\' not in s and '"' not in s and '\n' not in s and '\t' not in s:
+        return s
     return s.replace('\\', '\\\\').replace('"', '\\"').replace('\n', '\\n').replace('\t', '\\t')
 
 
@@ -422,36 +623,79 @@ def fix_german_quotes(s: str) -> str:
     return ''.join(result)
 
 
-def format_msgstr_for_po(msgstr: str) -> List[str]:
-    """Format msgstr for PO file (handles multi-line strings)."""
+def format_msgstr_for_po(msgstr: str, prefix: str = 'msgstr') -> List[str]:
+    """Format msgstr (or a plural form, via prefix) for PO file (handles multi-line strings)."""
     if not msgstr:
-        return ['msgstr ""']
+        return [f'{prefix} ""']
 
     if '\n' in msgstr:
-        lines = ['msgstr ""']
+        lines = [f'{prefix} ""']
         parts = msgstr.split('\n')
+        last_idx = len(parts) - 1
         for i, part in enumerate(parts):
-            if i < len(parts) - 1:
+            if i < last_idx:
                 lines.append(f'"{escape_po_string(part)}\\n"')
             else:
                 if part:
                     lines.append(f'"{escape_po_string(part)}"')
         return lines
     else:
-        return [f'msgstr "{escape_po_string(msgstr)}"']
+        return [f'{prefix} "{escape_po_string(msgstr)}"']
+
+
+# Lines buffered by write_po_file before each write() call
+WRITE_CHUNK_LINES = 4096
 
 
 def write_po_file(entries: List[POEntry], filepath: Path,
-                  remove_fuzzy_for: Optional[Set[str]] = None,
-                  add_fuzzy_for: Optional[Set[str]] = None):
-    """Write entries back to a PO file with proper formatting."""
+                  remove_fuzzy_for: Optional[AbstractSet[str]] = None,
+                  add_fuzzy_for: Optional[AbstractSet[str]] = None):
+    """Write entries back to a PO file with proper formatting.
+
+    The fuzzy sets only need membership tests, so dict.keys() views can be
+    passed without copying.
+    """
     remove_fuzzy_for = remove_fuzzy_for or set()
     add_fuzzy_for = add_fuzzy_for or set()
 
     # Language-specific post-processing
     is_german = '/de/' in str(filepath)
 
-    with open(filepath, 'w', encoding='utf-8') as f:
+    # Write next to the target and rename over it, so an interrupted write
+    # never leaves a truncated PO behind. Resolving first keeps a symlinked
+    # PO a symlink and puts the temp file beside the real file. A killed
+    # process can still leave "<name>.<pid>.tmp" there; it is git-ignored
+    # and safe to delete.
+    filepath = Path(filepath).resolve()
+    tmp_path = filepath.with_name(f"{filepath.name}.{os.getpid()}.tmp")
+    try:
+        _write_po_lines(entries, tmp_path, remove_fuzzy_for, add_fuzzy_for, is_german)
+        if filepath.exists():
+            st = filepath.stat()
+            os.chmod(tmp_path, st.st_mode & 0o7777)
+            if hasattr(os, 'chown'):
+                try:
+                    os.chown(tmp_path, st.st_uid, st.st_gid)
+                except OSError:
+                    pass  # only root may give files away; keep our own
+        os.replace(tmp_path, filepath)
+    except BaseException:
+        tmp_path.unlink(missing_ok=True)
+        raise
+
+
+def _write_po_lines(entries: List[POEntry], filepath: Path,
+                    remove_fuzzy_for: AbstractSet[str], add_fuzzy_for: AbstractSet[str],
+                    is_german: bool):
+    """Serialize entries to filepath; see write_po_file."""
+    # Collect lines in a list and hand them to the file in chunks of
+    # entries: one write() per chunk instead of one per line, without
+    # holding a second copy of the whole catalog in memory
+    with open(filepath, 'w', encoding='utf-8', buffering=1 << 20) as f:
+        out: List[str] = []
+        append = out.append
+        last_index = len(entries) - 1
+
         for i, entry in enumerate(entries):
             should_remove_fuzzy = entry.msgid in remove_fuzzy_for
             should_add_fuzzy = entry.msgid in add_fuzzy_for
@@ -465,56 +709,76 @@ def write_po_file(entries: List[POEntry], filepath: Path,
                     if should_add_fuzzy and 'fuzzy' not in flags:
                         flags.append('fuzzy')
                     if flags:
-                        f.write(f"#, {', '.join(flags)}\n")
+                        append(f"#, {', '.join(flags)}\n")
                     wrote_fuzzy_line = True
                 else:
-                    f.write(comment + '\n')
+                    append(comment + '\n')
 
             if should_add_fuzzy and not wrote_fuzzy_line:
-                f.write('#, fuzzy\n')
+                append('#, fuzzy\n')
 
             if '\n' in entry.msgid or len(entry.msgid) > 70:
-                f.write('msgid ""\n')
-                for part in entry.msgid.split('\n'):
+                append('msgid ""\n')
+                msgid_lines = entry.msgid.split('\n')
+                last_line_idx = len(msgid_lines) - 1
+                for line_idx, part in enumerate(msgid_lines):
                     escaped = escape_po_string(part)
-                    if part != entry.msgid.split('\n')[-1]:
-                        f.write(f'"{escaped}\\n"\n')
+                    if line_idx != last_line_idx:
+                        append(f'"{escaped}\\n"\n')
                     elif part:
-                        f.write(f'"{escaped}"\n')
+                        append(f'"{escaped}"\n')
             else:
-                f.write(f'msgid "{escape_po_string(entry.msgid)}"\n')
+                append(f'msgid "{escape_po_string(entry.msgid)}"\n')
 
             if entry.msgid_plural:
-                f.write(f'msgid_plural "{escape_po_string(entry.msgid_plural)}"\n')
+                append(f'msgid_plural "{escape_po_string(entry.msgid_plural)}"\n')
 
             msgstr = entry.msgstr
             if is_german and msgstr:
                 msgstr = fix_german_quotes(msgstr)
             for line in format_msgstr_for_po(msgstr):
-                f.write(line + '\n')
+                append(line + '\n')
 
             for idx, plural in enumerate(entry.msgstr_plural):
-                f.write(f'msgstr[{idx}] "{escape_po_string(plural)}"\n')
+                for line in format_msgstr_for_po(plural, f'msgstr[{idx}]'):
+                    append(line + '\n')
+
+            if i < last_index:
+                append('\n')
 
-            if i < len(entries) - 1:
-                f.write('\n')
+            if len(out) >= WRITE_CHUNK_LINES:
+                f.write(''.join(out))
+                out.clear()
+
+        f.write(''.join(out))
 
 # ============================================================================
 # Filtering and Status
 # ============================================================================
 
-def has_validation_issues(entry: POEntry) -> bool:
-    """Check if entry has validation errors or warnings."""
-    if not entry.msgstr:
-        return False
+@lru_cache(maxsize=65536)
+def _validation_counts(msgid: str, msgstr: str) -> Tuple[int, int]:
+    """Return (error_count, warning_count) for a msgid/msgstr pair.
 
-    source = NewlineHandler.encode(entry.msgid)
-    trans = NewlineHandler.encode(entry.msgstr)
+    Memoized so filtering and status passes over the same entries
+    don't validate a pair more than once.
+    """
+    # Encode for validation (same format as export)
+    source = NewlineHandler.encode(msgid)
+    trans = NewlineHandler.encode(msgstr)
 
     errors = PlaceholderValidator.validate(source, trans)
     warnings = PlaceholderValidator.validate_warnings(source, trans)
 
-    return bool(errors or warnings)
+    return len(errors), len(warnings)
+
+
+def has_validation_issues(entry: POEntry) -> bool:
+    """Check if entry has validation errors or warnings."""
+    if not entry.msgstr:
+        return False
+
+    return _validation_counts(entry.msgid, entry.msgstr) != (0, 0)
 
 
 def filter_entries(entries: List[POEntry], mode: str) -> List[POEntry]:
@@ -528,33 +792,50 @@ def filter_entries(entries: List[POEntry], mode: str) -> List[POEntry]:
 
     IMPORTANT: Verified translations are NEVER included.
     """
-    result = []
+    return list(filter_entries_iter(entries, mode))
+
+
+def filter_entries_iter(entries: List[POEntry], mode: str) -> Iterator[POEntry]:
+    """Lazy version of filter_entries for callers that only iterate or count."""
     for entry in entries:
         if entry.is_header or not entry.msgid:
             continue
-        if entry.is_verified:
-            continue
-
-        if mode == 'empty' and entry.is_empty:
-            result.append(entry)
-        elif mode == 'fuzzy' and entry.is_fuzzy:
-            result.append(entry)
+        # Header is ruled out above, so the entry properties reduce to these
+        is_fuzzy = entry.is_fuzzy
+        if entry.msgstr and not is_fuzzy:
+            continue  # verified
+
+        if mode == 'empty' and not entry.msgstr:
+            yield entry
+        elif mode == 'fuzzy' and is_fuzzy:
+            yield entry
         elif mode == 'all':
-            result.append(entry)
-        elif mode == 'errors' and entry.is_fuzzy and has_validation_issues(entry):
-            result.append(entry)
-
-    return result
+            yield entry
+        elif mode == 'errors' and is_fuzzy and has_validation_issues(entry):
+            yield entry
 
 
 def get_status(entries: List[POEntry]) -> dict:
     """Get translation status for entries."""
-    translatable = [e for e in entries if e.msgid and not e.is_header]
+    total = verified = fuzzy = empty = 0
+
+    # One pass; with the header excluded the entry properties reduce to these
+    for entry in entries:
+        if not entry.msgid or entry.is_header:
+            continue
+        total += 1
+        if entry.is_fuzzy:
+            fuzzy += 1
+        if not entry.msgstr:
+            empty += 1
+        elif not entry.is_fuzzy:
+            verified += 1
+
     return {
-        "total": len(translatable),
-        "verified": len([e for e in translatable if e.is_verified]),
-        "fuzzy": len([e for e in translatable if e.is_fuzzy]),
-        "empty": len([e for e in translatable if e.is_empty]),
+        "total": total,
+        "verified": verified,
+        "fuzzy": fuzzy,
+        "empty": empty,
     }
 
 # ============================================================================
@@ -563,10 +844,8 @@ def get_status(entries: List[POEntry]) -> dict:
 
 def generate_v2_header(lang_code: str, lang_name: str, count: int) -> str:
     """Generate minimal v2 export header."""
-    brands_str = ", ".join(BRANDS)
-    terms_str = ", ".join(TECH_TERMS)
     return f"""# {lang_name} - {count} strings
-# KEEP: {brands_str}, {terms_str}, %1, %2, {NEWLINE_MARKER}"""
+# KEEP: {BRANDS_STR}, {TECH_TERMS_STR}, %1, %2, {NEWLINE_MARKER}"""
 
 
 def export_v2_format(lang_code: str, entries: List[POEntry],
@@ -588,19 +867,18 @@ def export_v2_format(lang_code: str, entries: List[POEntry],
     lang_name = LANGUAGE_NAMES.get(lang_code, lang_code)
     header = generate_v2_header(lang_code, lang_name, len(entries))
 
-    # Build string list with newline encoding
+    # Encode newlines as [NL] once; batch files reuse the same strings
+    strings = {}
     mapping = {}
-    output_lines = [header, ""]
 
     for i, entry in enumerate(entries, 1):
-        # Encode newlines as [NL]
-        text = NewlineHandler.encode(entry.msgid)
-        output_lines.append(f"{i}. {text}")
+        strings[i] = entry.msgid_encoded
         mapping[i] = entry.msgid
 
-    # Write main file
-    with open(output_path, 'w', encoding='utf-8') as f:
-        f.write('\n'.join(output_lines))
+    # Write main file: header, blank line, then one numbered line per string
+    with open(output_path, 'w', encoding='utf-8', buffering=1 << 20) as f:
+        f.write(header + '\n')
+        f.writelines(f"\n{i}. {text}" for i, text in strings.items())
 
     # Write mapping
     with open(mapping_path, 'w', encoding='utf-8') as f:
@@ -609,7 +887,6 @@ def export_v2_format(lang_code: str, entries: List[POEntry],
     # Handle batch splitting if requested
     if num_batches > 0:
         batch_mgr = BatchManager(len(entries), num_batches)
-        strings = {i: NewlineHandler.encode(e.msgid) for i, e in enumerate(entries, 1)}
         batch_mgr.split_to_files(strings, output_path.parent, lang_code, header)
         print(f"  Created {num_batches} batch files")
 
@@ -621,21 +898,9 @@ def export_v2_format(lang_code: str, entries: List[POEntry],
 
 def parse_v2_numbered_format(text: str) -> Dict[int, str]:
     """Parse v2 numbered format back to dict."""
-    translations = {}
-
-    for line in text.split('\n'):
-        # Skip comments and empty lines
-        if line.startswith('#') or not line.strip():
-            continue
-
-        # Match numbered line
-        match = re.match(r'^(\d+)\.\s*(.*)$', line)
-        if match:
-            num = int(match.group(1))
-            trans_text = match.group(2).strip()
-            translations[num] = trans_text
-
-    return translations
+    # Comment and empty lines never start with a number, so one scan suffices
+    return {int(match.group(1)): match.group(2).strip()
+            for match in _NUMBERED_LINES_RE.finditer(text)}
 
 
 def import_v2_format(import_path: Path, mapping_path: Path,
@@ -657,8 +922,9 @@ def import_v2_format(import_path: Path, mapping_path: Path,
 
     translations_raw = parse_v2_numbered_format(content)
 
-    # Build msgid lookup
-    msgid_to_entry = {e.msgid: e for e in entries if e.msgid}
+    # Build msgid lookup, indexing only entries this import can touch
+    needed = {mapping[num] for num in translations_raw if num in mapping}
+    msgid_to_entry = {e.msgid: e for e in entries if e.msgid and e.msgid in needed}
 
     translations = {}
     errors = []
@@ -672,19 +938,20 @@ def import_v2_format(import_path: Path, mapping_path: Path,
             continue
 
         msgid = mapping[num]
-        source_encoded = NewlineHandler.encode(msgid)
+        entry = msgid_to_entry.get(msgid)
 
-        if msgid not in msgid_to_entry:
+        if entry is None:
             errors.append(f"#{num}: msgid not found in PO file")
             continue
 
-        entry = msgid_to_entry[msgid]
-
         # Skip verified
         if entry.is_verified:
             skipped += 1
             continue
 
+        # Only encode sources that will actually be validated
+        source_encoded = entry.msgid_encoded
+
         # Auto-fix if enabled
         if auto_fix:
             trans_text, fixes = PlaceholderValidator.auto_fix(source_encoded, trans_text)
@@ -729,7 +996,7 @@ def load_api_keys() -> dict:
     keys = {}
 
     # Simple Lua table parser for apikeys format
-    for match in re.finditer(r'(\w+)\s*=\s*"([^"]*)"', content):
+    for match in _APIKEY_RE.finditer(content):
         keys[match.group(1)] = match.group(2)
 
     return keys
@@ -748,6 +1015,8 @@ class Spinner:
         self.running = False
         self.thread = None
         self.start_time = None
+        # Redrawing only makes sense on a terminal; logs get the final line
+        self.enabled = sys.stdout.isatty()
 
     def _spin(self):
         """Spinner thread function."""
@@ -765,6 +1034,8 @@ class Spinner:
         """Start the spinner."""
         self.running = True
         self.start_time = time.time()
+        if not self.enabled:
+            return
         self.thread = threading.Thread(target=self._spin, daemon=True)
         self.thread.start()
 
@@ -780,6 +1051,95 @@ class Spinner:
         sys.stdout.flush()
 
 
+# ============================================================================
+# Translation Cache
+# ============================================================================
+
+TRANSLATION_CACHE_FILE = "translations.sqlite"
+
+
+class TranslationCache:
+    """Persistent store of API translations, keyed on source text and target.
+
+    Rows are keyed on (source, lang, provider, model), where source is the
+    newline-encoded msgid sent in the prompt and the value is the raw reply
+    for that line. Only replies that pass placeholder validation are kept,
+    so a cached string is always one a run would have applied.
+
+    Callers only look up strings whose entry has no translation yet. Fuzzy
+    or flawed strings are re-sent on purpose and must not get the same
+    answer back, but their new replies are still stored.
+    """
+
+    # Sources per lookup query (SQLite allows 999 parameters in old builds)
+    LOOKUP_CHUNK = 500
+
+    def __init__(self, path: Path):
+        path.parent.mkdir(parents=True, exist_ok=True)
+        # Shared by --parallel-languages workers, so access is serialized
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(str(path), check_same_thread=False)
+        # Saved once per batch: WAL without per-commit fsync keeps that cheap,
+        # and losing the last rows on a crash only costs a re-translation
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        self._conn.execute(
+            "CREATE TABLE IF NOT EXISTS tr (source TEXT, lang TEXT, provider TEXT, "
+            "model TEXT, trans TEXT, PRIMARY KEY (source, lang, provider, model))")
+
+    def lookup(self, strings: Dict[int, str], lang: str, provider: str,
+               model: str) -> Dict[int, str]:
+        """Return {num: translation} for the strings already in the cache."""
+        if not strings:
+            return {}
+        # Look up only these sources, so each query is a primary-key probe;
+        # chunked to stay under SQLite's bound-parameter limit
+        sources = list(set(strings.values()))
+        cached = {}
+        try:
+            with self._lock:
+                for i in range(0, len(sources), self.LOOKUP_CHUNK):
+                    chunk = sources[i:i + self.LOOKUP_CHUNK]
+                    marks = ", ".join("?" * len(chunk))
+                    cached.update(self._conn.execute(
+                        f"SELECT source, trans FROM tr WHERE source IN ({marks}) "
+                        "AND lang = ? AND provider = ? AND model = ?",
+                        (*chunk, lang, provider, model)))
+        except sqlite3.Error:
+            return {}
+        return {num: cached[text] for num, text in strings.items() if text in cached}
+
+    def store(self, strings: Dict[int, str], results: Dict[int, str], lang: str,
+              provider: str, model: str):
+        """Save the valid translations from one batch; failures are ignored."""
+        rows = []
+        for num, trans in results.items():
+            source = strings.get(num)
+            if source is None:
+                continue
+            fixed, _ = PlaceholderValidator.auto_fix(source, trans)
+            if not PlaceholderValidator.validate(source, fixed):
+                rows.append((source, lang, provider, model, trans))
+        if not rows:
+            return
+        try:
+            with self._lock, self._conn:
+                self._conn.executemany("INSERT OR REPLACE INTO tr VALUES (?, ?, ?, ?, ?)", rows)
+        except sqlite3.Error:
+            pass  # caching is best-effort
+
+
+def open_translation_cache(args, script_dir: Path) -> Optional[TranslationCache]:
+    """Open the translation cache for a run, or None with --no-cache."""
+    if args.no_cache:
+        return None
+    try:
+        return TranslationCache(get_cache_dir(script_dir) / TRANSLATION_CACHE_FILE)
+    except (OSError, sqlite3.Error) as e:
+        print(f"Warning: translation cache disabled ({e})")
+        return None
+
+
 # ============================================================================
 # API Translator
 # ============================================================================
@@ -794,37 +1154,77 @@ class APITranslator:
     MAX_RETRIES = 3
     RETRY_DELAY = 5  # seconds
 
-    def __init__(self, provider: str, model: str, api_key: str):
+    # Fixed part of every translation prompt
+    PROMPT_RULES = f"""CRITICAL RULES:
+1. Keep EXACTLY as-is: {BRANDS_STR}, {TECH_TERMS_STR}
+2. Keep placeholders EXACTLY: %1, %2, %3
+3. Keep newline markers EXACTLY: {NEWLINE_MARKER}
+4. Output ONLY numbered translations, no explanations"""
+
+    def __init__(self, provider: str, model: str, api_key: str, concurrency: int = 1,
+                 batch_size: Optional[int] = None,
+                 cache: Optional[TranslationCache] = None):
         self.provider = provider
         self.model = model
         self.api_key = api_key
+        self.batch_size = max(1, batch_size) if batch_size else self.BATCH_SIZE
+        # Number of batches sent to the API at the same time
+        self.concurrency = max(1, concurrency)
+        # Keep-alive connections, one per host and thread (see _post_json)
+        self._local = threading.local()
+        # http.client doesn't go through proxies; defer to urllib when one is set
+        self._use_urllib = bool(urllib.request.getproxies().get('https'))
+        # Reuses earlier replies and saves new ones as batches finish
+        self.cache = cache
 
     def translate_strings(self, strings: Dict[int, str], target_lang: str,
-                          progress_callback=None) -> Dict[int, str]:
-        """Translate all strings in batches."""
+                          progress_callback=None, quiet: bool = False,
+                          reusable: Optional[AbstractSet[int]] = None) -> Dict[int, str]:
+        """Translate all strings in batches.
+
+        quiet drops the per-batch progress lines and the spinner, for callers
+        that translate several languages at once. reusable holds the numbers
+        that may be answered from the cache: those whose entry has no
+        translation yet.
+        """
         results = {}
-        sorted_nums = sorted(strings.keys())
-        total_batches = (len(sorted_nums) + self.BATCH_SIZE - 1) // self.BATCH_SIZE
+        if self.cache and reusable:
+            results = self.cache.lookup({num: strings[num] for num in reusable if num in strings},
+                                        target_lang, self.provider, self.model)
+            if results and not quiet:
+                print(f"  {len(results)} strings from cache")
+
+        sorted_nums = sorted(num for num in strings if num not in results)
+        total_batches = (len(sorted_nums) + self.batch_size - 1) // self.batch_size
         total_strings = len(sorted_nums)
 
-        print(f"  {total_strings} strings in {total_batches} batch(es)")
+        if not quiet:
+            print(f"  {total_strings} strings in {total_batches} batch(es)")
 
+        batches = []
         for batch_idx in range(total_batches):
-            start_idx = batch_idx * self.BATCH_SIZE
-            end_idx = min(start_idx + self.BATCH_SIZE, len(sorted_nums))
-            batch_nums = sorted_nums[start_idx:end_idx]
+            start_idx = batch_idx * self.batch_size
+            end_idx = min(start_idx + self.batch_size, len(sorted_nums))
+            batches.append([(num, strings[num]) for num in sorted_nums[start_idx:end_idx]])
 
-            batch_strings = [(num, strings[num]) for num in batch_nums]
+        if self.concurrency > 1 and total_batches > 1:
+            results.update(self._translate_batches_concurrently(batches, target_lang,
+                                                                progress_callback, quiet))
+            return results
 
+        for batch_idx, batch_strings in enumerate(batches):
             # Show batch number
-            print(f"  [{batch_idx + 1}/{total_batches}] {len(batch_strings)} strings")
+            if not quiet:
+                print(f"  [{batch_idx + 1}/{total_batches}] {len(batch_strings)} strings")
 
             if progress_callback:
                 progress_callback(batch_idx + 1, total_batches)
 
             # Translate batch with retry (spinner shows live progress)
-            batch_results = self._translate_batch_with_retry(batch_strings, target_lang)
+            batch_results = self._translate_batch_with_retry(batch_strings, target_lang,
+                                                             not quiet)
             results.update(batch_results)
+            self._cache_batch(batch_strings, batch_results, target_lang)
 
             # Small delay between batches to avoid rate limits
             if batch_idx < total_batches - 1:
@@ -832,12 +1232,58 @@ class APITranslator:
 
         return results
 
+    def _translate_batches_concurrently(self, batches: List[List[Tuple[int, str]]],
+                                        target_lang: str, progress_callback=None,
+                                        quiet: bool = False) -> Dict[int, str]:
+        """Translate batches with up to self.concurrency requests in flight.
+
+        The pool size is what keeps us under provider rate limits, so there
+        is no delay between batches. The spinner is off: several threads
+        would fight over the same terminal line.
+        """
+        results = {}
+        total_batches = len(batches)
+        if not quiet:
+            print(f"  Sending up to {self.concurrency} batches at a time")
+
+        with ThreadPoolExecutor(max_workers=self.concurrency) as pool:
+            futures = {
+                pool.submit(self._translate_batch_with_retry, batch, target_lang, False): batch_idx
+                for batch_idx, batch in enumerate(batches, 1)
+            }
+            done_count = 0
+            try:
+                for future in as_completed(futures):
+                    batch_results = future.result()
+                    results.update(batch_results)
+                    done_count += 1
+                    batch_idx = futures[future]
+                    self._cache_batch(batches[batch_idx - 1], batch_results, target_lang)
+                    if not quiet:
+                        print(f"  [{done_count}/{total_batches}] batch {batch_idx}: "
+                              f"{len(batch_results)}/{len(batches[batch_idx - 1])} strings ✓")
+                    if progress_callback:
+                        progress_callback(done_count, total_batches)
+            except Exception:
+                # Don't start batches that are still queued
+                for future in futures:
+                    future.cancel()
+                raise
+
+        return results
+
+    def _cache_batch(self, batch: List[Tuple[int, str]], batch_results: Dict[int, str],
+                     target_lang: str):
+        """Save a finished batch, so a later failure doesn't lose it."""
+        if self.cache:
+            self.cache.store(dict(batch), batch_results, target_lang, self.provider, self.model)
+
     def _translate_batch_with_retry(self, batch: List[Tuple[int, str]],
-                                    target_lang: str) -> Dict[int, str]:
+                                    target_lang: str, show_spinner: bool = True) -> Dict[int, str]:
         """Translate a batch with retry logic."""
         for attempt in range(self.MAX_RETRIES):
             try:
-                return self._translate_batch(batch, target_lang)
+                return self._translate_batch(batch, target_lang, show_spinner)
             except Exception as e:
                 if attempt < self.MAX_RETRIES - 1:
                     print(f"  Retry {attempt + 1}/{self.MAX_RETRIES} after error: {e}")
@@ -846,20 +1292,18 @@ class APITranslator:
                     raise
         return {}
 
-    def _translate_batch(self, batch: List[Tuple[int, str]], target_lang: str) -> Dict[int, str]:
+    def _translate_batch(self, batch: List[Tuple[int, str]], target_lang: str,
+                         show_spinner: bool = True) -> Dict[int, str]:
         """Translate a single batch via API."""
         prompt = self._build_prompt(batch, target_lang)
 
+        if not show_spinner:
+            return self._parse_response(self._call_provider(prompt), batch)
+
         spinner = Spinner(self.provider)
         spinner.start()
         try:
-            if self.provider == "anthropic":
-                response = self._call_anthropic(prompt)
-            elif self.provider == "openai":
-                response = self._call_openai(prompt)
-            else:
-                spinner.stop(success=False)
-                raise ValueError(f"Unknown provider: {self.provider}")
+            response = self._call_provider(prompt)
             spinner.stop(success=True)
         except Exception:
             spinner.stop(success=False)
@@ -868,23 +1312,19 @@ class APITranslator:
         # Parse response
         return self._parse_response(response, batch)
 
+    def _call_provider(self, prompt: str) -> str:
+        """Send a prompt to the configured provider."""
+        if self.provider == "anthropic":
+            return self._call_anthropic(prompt)
+        elif self.provider == "openai":
+            return self._call_openai(prompt)
+        raise ValueError(f"Unknown provider: {self.provider}")
+
     def _build_prompt(self, batch: List[Tuple[int, str]], lang: str) -> str:
         """Build translation prompt for API."""
         lang_name = LANGUAGE_NAMES.get(lang, lang)
-        brands_str = ", ".join(BRANDS)
-        terms_str = ", ".join(TECH_TERMS)
-
-        numbered = "\n".join(f"{num}. {text}" for num, text in batch)
-
-        return f"""Translate these UI strings to {lang_name}.
-
-CRITICAL RULES:
-1. Keep EXACTLY as-is: {brands_str}, {terms_str}
-2. Keep placeholders EXACTLY: %1, %2, %3
-3. Keep newline markers EXACTLY: {NEWLINE_MARKER}
-4. Output ONLY numbered translations, no explanations
-
-{numbered}"""
+        numbered = "\n".join([f"{num}. {text}" for num, text in batch])
+        return f"Translate these UI strings to {lang_name}.\n\n{self.PROMPT_RULES}\n\n{numbered}"
 
     def _call_anthropic(self, prompt: str) -> str:
         """Call Anthropic Messages API."""
@@ -908,16 +1348,7 @@ CRITICAL RULES:
             ]
         }
 
-        req = urllib.request.Request(
-            url,
-            data=json.dumps(data).encode('utf-8'),
-            headers=headers,
-            method='POST'
-        )
-
-        with urllib.request.urlopen(req, timeout=120) as response:
-            result = json.loads(response.read().decode('utf-8'))
-
+        result = self._post_json(url, headers, data)
         return result['content'][0]['text']
 
     def _call_openai(self, prompt: str) -> str:
@@ -937,17 +1368,56 @@ CRITICAL RULES:
             "max_tokens": 4096
         }
 
-        req = urllib.request.Request(
-            url,
-            data=json.dumps(data).encode('utf-8'),
-            headers=headers,
-            method='POST'
-        )
+        result = self._post_json(url, headers, data)
+        return result['choices'][0]['message']['content']
 
-        with urllib.request.urlopen(req, timeout=120) as response:
-            result = json.loads(response.read().decode('utf-8'))
+    def _post_json(self, url: str, headers: Dict[str, str], data: dict) -> dict:
+        """POST data as JSON and return the decoded JSON response.
 
-        return result['choices'][0]['message']['content']
+        Reuses one HTTPS connection per host, so batches after the first skip
+        the TCP/TLS handshake. Connections are per thread because an
+        http.client connection can't carry concurrent requests.
+        """
+        body = json.dumps(data).encode('utf-8')
+
+        if self._use_urllib:
+            req = urllib.request.Request(url, data=body, headers=headers, method='POST')
+            with urllib.request.urlopen(req, timeout=120) as response:
+                return json.loads(response.read().decode('utf-8'))
+
+        parts = urllib.parse.urlsplit(url)
+        conns = getattr(self._local, 'conns', None)
+        if conns is None:
+            conns = self._local.conns = {}
+
+        for attempt in range(2):
+            conn = conns.get(parts.netloc)
+            reused = conn is not None
+            if conn is None:
+                conn = conns[parts.netloc] = http.client.HTTPSConnection(parts.netloc, timeout=120)
+            try:
+                conn.request('POST', parts.path, body=body, headers=headers)
+                response = conn.getresponse()
+                payload = response.read()
+                break
+            except (ConnectionResetError, BrokenPipeError):
+                conn.close()
+                del conns[parts.netloc]
+                # The server may have closed an idle keep-alive connection;
+                # retry once on a fresh one before giving up
+                if not reused or attempt:
+                    raise
+            except Exception:
+                conn.close()
+                del conns[parts.netloc]
+                raise
+
+        if not 200 <= response.status < 300:
+            # Same error urlopen raised, so retry messages stay unchanged
+            raise urllib.error.HTTPError(url, response.status, response.reason,
+                                         response.headers, None)
+
+        return json.loads(payload.decode('utf-8'))
 
     def _parse_response(self, response: str, batch: List[Tuple[int, str]]) -> Dict[int, str]:
         """Parse API response to extract translations."""
@@ -955,7 +1425,7 @@ CRITICAL RULES:
         expected_nums = {num for num, _ in batch}
 
         for line in response.split('\n'):
-            match = re.match(r'^(\d+)\.\s*(.*)$', line.strip())
+            match = _NUMBERED_LINE_RE.match(line.strip())
             if match:
                 num = int(match.group(1))
                 text = match.group(2).strip()
@@ -975,6 +1445,30 @@ def get_exports_dir(script_dir: Path) -> Path:
     return exports_dir
 
 
+def get_cache_dir(script_dir: Path) -> Path:
+    """Get directory for parse caches (created on first write)."""
+    return script_dir / "exports" / ".cache"
+
+
+def find_po_files(locale_dir: Path) -> Dict[str, Path]:
+    """Map known language codes to their existing PO files.
+
+    Lists locale_dir once so languages without a directory cost no stat.
+    """
+    try:
+        with os.scandir(locale_dir) as it:
+            lang_dirs = {d.name for d in it if d.name in LANGUAGE_NAMES and d.is_dir()}
+    except FileNotFoundError:
+        return {}
+
+    po_files = {}
+    for lang_code in lang_dirs:
+        po_path = locale_dir / lang_code / "LC_MESSAGES" / "koassistant.po"
+        if po_path.is_file():
+            po_files[lang_code] = po_path
+    return po_files
+
+
 def cmd_status(args, entries: List[POEntry]):
     """Show translation status."""
     status = get_status(entries)
@@ -991,9 +1485,10 @@ def cmd_status(args, entries: List[POEntry]):
         empty_pct = status['empty'] * 100 // status['total']
         print(f"         ({verified_pct}% verified, {fuzzy_pct}% fuzzy, {empty_pct}% empty)")
 
-    # Show next steps
-    empty_count = len(filter_entries(entries, 'empty'))
-    fuzzy_count = len(filter_entries(entries, 'fuzzy'))
+    # Show next steps (empty and fuzzy entries are never verified, so these
+    # match what filter_entries would select for each mode)
+    empty_count = status['empty']
+    fuzzy_count = status['fuzzy']
 
     if empty_count > 0 or fuzzy_count > 0:
         print(f"\nNext steps:")
@@ -1101,12 +1596,12 @@ def cmd_import(args, entries: List[POEntry], po_path: Path, script_dir: Path):
 
     # Write with fuzzy markers (unless --verified)
     if args.verified:
-        remove_fuzzy = set(translations.keys())
+        remove_fuzzy = translations.keys()
         add_fuzzy = set()
         marker = "human-verified"
     else:
         remove_fuzzy = set()
-        add_fuzzy = set(translations.keys())
+        add_fuzzy = translations.keys()
         marker = "fuzzy (AI-translated)"
 
     write_po_file(entries, po_path, remove_fuzzy_for=remove_fuzzy, add_fuzzy_for=add_fuzzy)
@@ -1164,6 +1659,10 @@ def cmd_run(args, entries: List[POEntry], po_path: Path, script_dir: Path):
         print("Supported: anthropic, openai")
         return 1
 
+    if args.parallel_languages > 1:
+        print("Warning: --parallel-languages only applies to lang 'all' or a "
+              "comma-separated list; ignored for a single language")
+
     # Load API keys
     api_keys = load_api_keys()
     api_key = api_keys.get(provider)
@@ -1213,21 +1712,28 @@ def cmd_run(args, entries: List[POEntry], po_path: Path, script_dir: Path):
             print("Cancelled.")
             return 0
 
-    # Build strings dict with newline encoding
+    # Build strings dict with newline encoding; untranslated entries may be
+    # served from the translation cache
     strings = {}
     msgid_by_num = {}
+    untranslated = set()
     for i, entry in enumerate(to_translate, 1):
-        strings[i] = NewlineHandler.encode(entry.msgid)
+        strings[i] = entry.msgid_encoded
         msgid_by_num[i] = entry.msgid
+        if entry.is_empty:
+            untranslated.add(i)
 
     # Create translator and translate
-    translator = APITranslator(provider, model, api_key)
+    translator = APITranslator(provider, model, api_key, concurrency=args.concurrency,
+                               batch_size=args.batch_size,
+                               cache=open_translation_cache(args, script_dir))
 
     def progress(batch, total):
         print(f"  Translating batch {batch}/{total}...")
 
     print()
-    results = translator.translate_strings(strings, args.lang, progress_callback=progress)
+    results = translator.translate_strings(strings, args.lang, progress_callback=progress,
+                                           reusable=untranslated)
 
     # Validate and apply
     translations = {}
@@ -1266,14 +1772,13 @@ def cmd_run(args, entries: List[POEntry], po_path: Path, script_dir: Path):
         print("No valid translations to apply.")
         return 1
 
-    # Apply translations
-    for entry in entries:
+    # Apply translations (keys are msgids of the entries sent for translation)
+    for entry in to_translate:
         if entry.msgid in translations:
             entry.msgstr = translations[entry.msgid]
 
     # Write with fuzzy markers (ALWAYS for API translations)
-    add_fuzzy = set(translations.keys())
-    write_po_file(entries, po_path, add_fuzzy_for=add_fuzzy)
+    write_po_file(entries, po_path, add_fuzzy_for=translations.keys())
 
     print(f"\nApplied {len(translations)} translations (fuzzy)")
     print(f"Updated: {po_path}")
@@ -1290,17 +1795,35 @@ def validate_all_translations(entries: List[POEntry]) -> Tuple[int, int]:
         if entry.is_header or not entry.msgid or not entry.msgstr:
             continue
 
-        # Encode for validation (same format as export)
-        source = NewlineHandler.encode(entry.msgid)
-        trans = NewlineHandler.encode(entry.msgstr)
+        entry_errors, entry_warnings = _validation_counts(entry.msgid, entry.msgstr)
+        errors += entry_errors
+        warnings += entry_warnings
 
-        validation_errors = PlaceholderValidator.validate(source, trans)
-        validation_warnings = PlaceholderValidator.validate_warnings(source, trans)
+    return errors, warnings
 
-        errors += len(validation_errors)
-        warnings += len(validation_warnings)
 
-    return errors, warnings
+def _cached_language_status(po_path: Path,
+                            cache_dir: Path) -> Optional[Tuple[dict, int, int]]:
+    """Return the cached _language_status result, or None if stale or missing."""
+    return _read_cache(_cache_path(po_path, cache_dir, 'status'),
+                       _validation_cache_key(po_path))
+
+
+def _language_status(po_path: Path, cache_dir: Path) -> Tuple[dict, int, int]:
+    """Return (status, error_count, warning_count) for one PO file.
+
+    The result is cached next to the parsed entries, so an unchanged
+    language costs one stat and one small unpickle.
+    """
+    key = _validation_cache_key(po_path)
+    cache_path = _cache_path(po_path, cache_dir, 'status')
+    result = _read_cache(cache_path, key)
+    if result is None:
+        entries = parse_po_file_cached(po_path, cache_dir)
+        errors, warnings = validate_all_translations(entries)
+        result = (get_status(entries), errors, warnings)
+        _write_cache(cache_path, key, result)
+    return result
 
 
 def cmd_all_status(script_dir: Path, locale_dir: Path):
@@ -1316,15 +1839,41 @@ def cmd_all_status(script_dir: Path, locale_dir: Path):
     sum_errors = 0
     sum_warnings = 0
 
-    for lang_code in sorted(LANGUAGE_NAMES.keys()):
-        po_path = locale_dir / lang_code / "LC_MESSAGES" / "koassistant.po"
-        if not po_path.exists():
-            print(f"{lang_code:<7} {'MISSING':<5}")
+    cache_dir = get_cache_dir(script_dir)
+    lang_codes = LANGUAGE_CODES
+    po_paths = find_po_files(locale_dir)
+    present = [lang_code for lang_code in lang_codes if lang_code in po_paths]
+
+    # Serve unchanged languages from the status cache; a warm pass is far
+    # cheaper than starting worker processes
+    results = {}
+    misses = []
+    for lang_code in present:
+        cached = _cached_language_status(po_paths[lang_code], cache_dir)
+        if cached is None:
+            misses.append(lang_code)
+        else:
+            results[lang_code] = cached
+
+    # Languages are independent, so parse and validate the misses in parallel
+    workers = min(os.cpu_count() or 1, len(misses))
+    if workers > 1:
+        with ProcessPoolExecutor(max_workers=workers) as pool:
+            statuses = pool.map(_language_status, [po_paths[c] for c in misses],
+                                [cache_dir] * len(misses))
+            results.update(zip(misses, statuses))
+    else:
+        for lang_code in misses:
+            results[lang_code] = _language_status(po_paths[lang_code], cache_dir)
+
+    # Collect the table rows and print them in one write
+    rows = []
+    for lang_code in lang_codes:
+        if lang_code not in results:
+            rows.append(f"{lang_code:<7} {'MISSING':<5}")
             continue
 
-        entries = parse_po_file(po_path)
-        status = get_status(entries)
-        errors, warnings = validate_all_translations(entries)
+        status, errors, warnings = results[lang_code]
 
         sum_total += status['total']
         sum_verified += status['verified']
@@ -1343,15 +1892,36 @@ def cmd_all_status(script_dir: Path, locale_dir: Path):
         else:
             warn_str = f"{warnings:>5}"
 
-        print(f"{lang_code:<7} {status['total']:>5} {status['verified']:>6} "
-              f"{status['fuzzy']:>6} {status['empty']:>6} {err_str} {warn_str}")
+        rows.append(f"{lang_code:<7} {status['total']:>5} {status['verified']:>6} "
+                    f"{status['fuzzy']:>6} {status['empty']:>6} {err_str} {warn_str}")
 
-    print("-" * 49)
-    print(f"{'TOTAL':<7} {sum_total:>5} {sum_verified:>6} {sum_fuzzy:>6} {sum_empty:>6} {sum_errors:>5} {sum_warnings:>5}")
+    rows.append("-" * 49)
+    rows.append(f"{'TOTAL':<7} {sum_total:>5} {sum_verified:>6} {sum_fuzzy:>6} {sum_empty:>6} {sum_errors:>5} {sum_warnings:>5}")
+    print('\n'.join(rows))
 
     return 0
 
 
+def _select_entries(po_path: Path, cache_dir: Path,
+                    mode: str) -> Tuple[List[POEntry], List[POEntry]]:
+    """Return (to_translate, entries) for one language's PO file.
+
+    Whether a file has anything to translate in `mode` is cached on its
+    mtime and size, so languages that are already done are skipped
+    without loading their entries; those return ([], []).
+    """
+    # 'errors' mode selects by validation, so key every mode on the term lists
+    key = _validation_cache_key(po_path)
+    cache_path = _cache_path(po_path, cache_dir, f'pending-{mode}')
+    if _read_cache(cache_path, key) == 0:
+        return [], []
+
+    entries = parse_po_file_cached(po_path, cache_dir)
+    to_translate = filter_entries(entries, mode)
+    _write_cache(cache_path, key, len(to_translate))
+    return to_translate, entries
+
+
 def cmd_all_run(args, script_dir: Path, locale_dir: Path):
     """Run translation for all languages."""
     if not args.api:
@@ -1398,22 +1968,22 @@ def cmd_all_run(args, script_dir: Path, locale_dir: Path):
 
     # Collect languages that need work
     languages_to_process = []
-    for lang_code in sorted(LANGUAGE_NAMES.keys()):
-        po_path = locale_dir / lang_code / "LC_MESSAGES" / "koassistant.po"
-        if not po_path.exists():
+    po_paths = find_po_files(locale_dir)
+    for lang_code in LANGUAGE_CODES:
+        po_path = po_paths.get(lang_code)
+        if po_path is None:
             continue
 
-        entries = parse_po_file(po_path)
-        to_translate = filter_entries(entries, mode)
+        to_translate, entries = _select_entries(po_path, get_cache_dir(script_dir), mode)
 
         if to_translate:
-            languages_to_process.append((lang_code, len(to_translate), po_path, entries))
+            languages_to_process.append((lang_code, to_translate, po_path, entries))
 
     if not languages_to_process:
         print(f"\nNo languages have {mode_desc[mode]} strings to translate.")
         return 0
 
-    total_strings = sum(count for _, count, _, _ in languages_to_process)
+    total_strings = sum(len(to_translate) for _, to_translate, _, _ in languages_to_process)
     print(f"\nLanguages to process: {len(languages_to_process)}")
     print(f"Total strings: {total_strings}")
 
@@ -1425,55 +1995,12 @@ def cmd_all_run(args, script_dir: Path, locale_dir: Path):
             return 0
 
     # Process each language
-    translator = APITranslator(provider, model, api_key)
-    success_count = 0
-    fail_count = 0
-
-    for lang_code, count, po_path, entries in languages_to_process:
-        lang_name = LANGUAGE_NAMES.get(lang_code, lang_code)
-        print(f"\n--- {lang_name} ({lang_code}): {count} strings ---")
-
-        to_translate = filter_entries(entries, mode)
-
-        # Build strings dict (same pattern as cmd_run)
-        strings = {}
-        msgid_by_num = {}
-        for i, entry in enumerate(to_translate, 1):
-            strings[i] = NewlineHandler.encode(entry.msgid)
-            msgid_by_num[i] = entry.msgid
-
-        try:
-            results = translator.translate_strings(strings, lang_code)
-
-            # Build translations dict
-            translations = {}
-            add_fuzzy = set()
-
-            for num, trans_text in results.items():
-                source_encoded = strings.get(num, "")
-                msgid = msgid_by_num.get(num)
-                if not msgid:
-                    continue
-
-                # Auto-fix and decode
-                trans_text, _ = PlaceholderValidator.auto_fix(source_encoded, trans_text)
-                final_text = NewlineHandler.decode(trans_text)
-                translations[msgid] = final_text
-                add_fuzzy.add(msgid)
-
-            # Apply translations
-            for entry in entries:
-                if entry.msgid in translations:
-                    entry.msgstr = translations[entry.msgid]
-
-            # Write back
-            write_po_file(entries, po_path, add_fuzzy_for=add_fuzzy)
-            print(f"  Applied {len(translations)} translations")
-            success_count += 1
-
-        except Exception as e:
-            print(f"  ERROR: {e}")
-            fail_count += 1
+    translator = APITranslator(provider, model, api_key, concurrency=args.concurrency,
+                               batch_size=args.batch_size,
+                               cache=open_translation_cache(args, script_dir))
+    # Reuse the entries selected while collecting, rather than filtering again
+    success_count, fail_count = _run_languages(translator, languages_to_process,
+                                               args.parallel_languages)
 
     print(f"\n=== Complete ===")
     print(f"Success: {success_count} languages")
@@ -1483,6 +2010,102 @@ def cmd_all_run(args, script_dir: Path, locale_dir: Path):
     return 0 if fail_count == 0 else 1
 
 
+def _translate_language(translator: 'APITranslator', lang_code: str,
+                        to_translate: List[POEntry], entries: List[POEntry],
+                        po_path: Path, quiet: bool = False) -> int:
+    """Translate one language's selected entries and write its PO file.
+
+    Returns the number of translations applied.
+    """
+    # Build strings dict (same pattern as cmd_run)
+    strings = {}
+    msgid_by_num = {}
+    untranslated = set()
+    for i, entry in enumerate(to_translate, 1):
+        strings[i] = entry.msgid_encoded
+        msgid_by_num[i] = entry.msgid
+        if entry.is_empty:
+            untranslated.add(i)
+
+    results = translator.translate_strings(strings, lang_code, quiet=quiet,
+                                           reusable=untranslated)
+
+    # Build translations dict
+    translations = {}
+    add_fuzzy = set()
+
+    for num, trans_text in results.items():
+        source_encoded = strings.get(num, "")
+        msgid = msgid_by_num.get(num)
+        if not msgid:
+            continue
+
+        # Auto-fix and decode
+        trans_text, _ = PlaceholderValidator.auto_fix(source_encoded, trans_text)
+        final_text = NewlineHandler.decode(trans_text)
+        translations[msgid] = final_text
+        add_fuzzy.add(msgid)
+
+    # Apply translations (keys are msgids of the entries sent for translation)
+    for entry in to_translate:
+        if entry.msgid in translations:
+            entry.msgstr = translations[entry.msgid]
+
+    # Write back
+    write_po_file(entries, po_path, add_fuzzy_for=add_fuzzy)
+    return len(translations)
+
+
+def _run_languages(translator: 'APITranslator',
+                   languages: List[Tuple[str, List[POEntry], Path, List[POEntry]]],
+                   parallel: int = 1) -> Tuple[int, int]:
+    """Translate each (lang_code, to_translate, po_path, entries) in turn.
+
+    With parallel > 1, up to that many languages are in flight at once. Each
+    language writes its own PO file, so the only shared state is the
+    terminal: per-batch progress is suppressed and one line is printed as
+    each language finishes. Returns (success_count, fail_count).
+    """
+    success_count = 0
+    fail_count = 0
+
+    if parallel <= 1 or len(languages) <= 1:
+        for lang_code, to_translate, po_path, entries in languages:
+            lang_name = LANGUAGE_NAMES.get(lang_code, lang_code)
+            print(f"\n--- {lang_name} ({lang_code}): {len(to_translate)} strings ---")
+            try:
+                applied = _translate_language(translator, lang_code, to_translate,
+                                              entries, po_path)
+                print(f"  Applied {applied} translations")
+                success_count += 1
+            except Exception as e:
+                print(f"  ERROR: {e}")
+                fail_count += 1
+        return success_count, fail_count
+
+    workers = min(parallel, len(languages))
+    print(f"\nTranslating up to {workers} languages at a time")
+
+    with ThreadPoolExecutor(max_workers=workers) as pool:
+        futures = {
+            pool.submit(_translate_language, translator, lang_code, to_translate,
+                        entries, po_path, True): (lang_code, len(to_translate))
+            for lang_code, to_translate, po_path, entries in languages
+        }
+        for future in as_completed(futures):
+            lang_code, count = futures[future]
+            lang_name = LANGUAGE_NAMES.get(lang_code, lang_code)
+            try:
+                applied = future.result()
+                print(f"  {lang_name} ({lang_code}): applied {applied}/{count} translations")
+                success_count += 1
+            except Exception as e:
+                print(f"  {lang_name} ({lang_code}): ERROR: {e}")
+                fail_count += 1
+
+    return success_count, fail_count
+
+
 def cmd_multi_run(args, langs: List[str], script_dir: Path, locale_dir: Path):
     """Run translation for specified languages (comma-separated)."""
     if not args.api:
@@ -1530,21 +2153,21 @@ def cmd_multi_run(args, langs: List[str], script_dir: Path, locale_dir: Path):
 
     # Collect languages that need work
     languages_to_process = []
+    po_paths = find_po_files(locale_dir)
     for lang_code in langs:
         if lang_code not in LANGUAGE_NAMES:
             print(f"Warning: Unknown language code '{lang_code}', skipping")
             continue
 
-        po_path = locale_dir / lang_code / "LC_MESSAGES" / "koassistant.po"
-        if not po_path.exists():
+        po_path = po_paths.get(lang_code)
+        if po_path is None:
             print(f"Warning: PO file not found for '{lang_code}', skipping")
             continue
 
-        entries = parse_po_file(po_path)
-        to_translate = filter_entries(entries, mode)
+        to_translate, entries = _select_entries(po_path, get_cache_dir(script_dir), mode)
 
         if to_translate:
-            languages_to_process.append((lang_code, len(to_translate), po_path, entries))
+            languages_to_process.append((lang_code, to_translate, po_path, entries))
         else:
             print(f"  {lang_code}: No {mode_desc[mode]} strings")
 
@@ -1552,7 +2175,7 @@ def cmd_multi_run(args, langs: List[str], script_dir: Path, locale_dir: Path):
         print(f"\nNo languages have {mode_desc[mode]} strings to translate.")
         return 0
 
-    total_strings = sum(count for _, count, _, _ in languages_to_process)
+    total_strings = sum(len(to_translate) for _, to_translate, _, _ in languages_to_process)
     print(f"\nLanguages to process: {len(languages_to_process)}")
     print(f"Total strings: {total_strings}")
 
@@ -1564,55 +2187,12 @@ def cmd_multi_run(args, langs: List[str], script_dir: Path, locale_dir: Path):
             return 0
 
     # Process each language
-    translator = APITranslator(provider, model, api_key)
-    success_count = 0
-    fail_count = 0
-
-    for lang_code, count, po_path, entries in languages_to_process:
-        lang_name = LANGUAGE_NAMES.get(lang_code, lang_code)
-        print(f"\n--- {lang_name} ({lang_code}): {count} strings ---")
-
-        to_translate = filter_entries(entries, mode)
-
-        # Build strings dict (same pattern as cmd_run)
-        strings = {}
-        msgid_by_num = {}
-        for i, entry in enumerate(to_translate, 1):
-            strings[i] = NewlineHandler.encode(entry.msgid)
-            msgid_by_num[i] = entry.msgid
-
-        try:
-            results = translator.translate_strings(strings, lang_code)
-
-            # Build translations dict
-            translations = {}
-            add_fuzzy = set()
-
-            for num, trans_text in results.items():
-                source_encoded = strings.get(num, "")
-                msgid = msgid_by_num.get(num)
-                if not msgid:
-                    continue
-
-                # Auto-fix and decode
-                trans_text, _ = PlaceholderValidator.auto_fix(source_encoded, trans_text)
-                final_text = NewlineHandler.decode(trans_text)
-                translations[msgid] = final_text
-                add_fuzzy.add(msgid)
-
-            # Apply translations
-            for entry in entries:
-                if entry.msgid in translations:
-                    entry.msgstr = translations[entry.msgid]
-
-            # Write back
-            write_po_file(entries, po_path, add_fuzzy_for=add_fuzzy)
-            print(f"  Applied {len(translations)} translations")
-            success_count += 1
-
-        except Exception as e:
-            print(f"  ERROR: {e}")
-            fail_count += 1
+    translator = APITranslator(provider, model, api_key, concurrency=args.concurrency,
+                               batch_size=args.batch_size,
+                               cache=open_translation_cache(args, script_dir))
+    # Reuse the entries selected while collecting, rather than filtering again
+    success_count, fail_count = _run_languages(translator, languages_to_process,
+                                               args.parallel_languages)
 
     print(f"\n=== Complete ===")
     print(f"Success: {success_count} languages")
@@ -1653,23 +2233,43 @@ def cmd_clean(args, script_dir: Path):
         print("Exports directory doesn't exist.")
         return 0
 
-    # Find files to delete
-    if args.lang == "all":
-        # Delete all files
-        files = list(exports_dir.glob("*.txt")) + list(exports_dir.glob("*.json"))
-    else:
-        # Delete only files for this language
-        files = list(exports_dir.glob(f"{args.lang}*.txt")) + list(exports_dir.glob(f"{args.lang}*.json"))
+    # Find files to delete (all files, or only files for this language),
+    # in a single directory scan
+    prefix = "" if args.lang == "all" else args.lang
+    with os.scandir(exports_dir) as it:
+        files = [Path(f.path) for f in it
+                 if f.name.startswith(prefix) and f.name.endswith(('.txt', '.json')) and f.is_file()]
+    # Parse/status caches are rebuilt on demand; the translation cache holds
+    # paid API results, so it only goes with an explicit --cache
+    cache_dir = get_cache_dir(script_dir)
+    if args.lang == "all" and cache_dir.is_dir():
+        with os.scandir(cache_dir) as it:
+            files += [Path(f.path) for f in it if f.name.endswith('.pickle')]
+
+    db_files = []
+    if args.cache:
+        if args.lang != "all":
+            print("Note: the translation cache is shared by all languages, use 'all clean --cache'")
+        else:
+            db_path = cache_dir / TRANSLATION_CACHE_FILE
+            db_files = [p for p in (db_path, db_path.with_name(db_path.name + '-wal'),
+                                    db_path.with_name(db_path.name + '-shm')) if p.exists()]
 
-    if not files:
+    if not files and not db_files:
         print("No export files to clean.")
         return 0
 
-    print(f"Files to delete ({len(files)}):")
-    for f in sorted(files)[:10]:
-        print(f"  {f.name}")
-    if len(files) > 10:
-        print(f"  ... and {len(files) - 10} more")
+    if files:
+        print(f"Files to delete ({len(files)}):")
+        for f in sorted(files)[:10]:
+            print(f"  {f.name}")
+        if len(files) > 10:
+            print(f"  ... and {len(files) - 10} more")
+    if db_files:
+        print("Translation cache to delete (saved API results):")
+        for f in db_files:
+            print(f"  {f.name}")
+    files += db_files
 
     # Confirm
     if not args.yes:
@@ -1743,6 +2343,17 @@ ALL AI translations are marked fuzzy. Verified translations are never touched.
     # API options
     parser.add_argument("--api", help="API provider (anthropic or openai)")
     parser.add_argument("--model", help="Model name (e.g., claude-sonnet-4-5, gpt-4o)")
+    parser.add_argument("--concurrency", type=int, default=1,
+                        help="Number of API batches to send in parallel (default: 1)")
+    parser.add_argument("--parallel-languages", type=int, default=1,
+                        help="Languages to translate at once with lang 'all' or a "
+                             "comma-separated list; multiplies --concurrency (default: 1)")
+    parser.add_argument("--no-cache", action="store_true",
+                        help="Don't reuse or save API translations (run commands)")
+    parser.add_argument("--cache", action="store_true",
+                        help="With 'all clean', also delete the saved API translation cache")
+    parser.add_argument("--batch-size", type=int,
+                        help=f"Strings per API request (default: {APITranslator.BATCH_SIZE})")
 
     args = parser.parse_args()
 
@@ -1801,7 +2412,7 @@ ALL AI translations are marked fuzzy. Verified translations are never touched.
         sys.exit(1)
 
     # Parse PO file
-    entries = parse_po_file(po_path)
+    entries = parse_po_file_cached(po_path, get_cache_dir(script_dir))
 
     # Dispatch command
     if args.command == "status":